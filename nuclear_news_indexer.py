@@ -25,49 +25,81 @@ Usage:
 
 # Version 2.8.2: Enhanced HTTP headers to better emulate real browsers
 
+import argparse
+import hashlib
+import html
 import json
 import logging
 import os
+import re
+import sqlite3
 import sys
-import uuid
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from functools import partial
+from logging.handlers import MemoryHandler
+from typing import Any, Iterable, Iterator, Optional, TextIO, Tuple, Union
+from urllib.parse import urlsplit
 
 import feedparser
 import requests
-from azure.core.credentials import AzureKeyCredential
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
-from azure.search.documents import SearchClient
 from dotenv import load_dotenv
-from openai import AzureOpenAI
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.worksheet import Worksheet
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
-# Configure logging
+# Logging is configured by configure_logging() when the script runs
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
 LOG_FILE = os.path.join(
     LOG_DIR, f'news_indexer_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
 )
-os.makedirs(LOG_DIR, exist_ok=True)
-logging.basicConfig(
-    filename=LOG_FILE,
-    filemode="a",
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    level=logging.INFO,
-)
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 logger = logging.getLogger(__name__)
-# Add console handler
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.INFO)
-console_handler.setFormatter(
-    logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
-)
-logger.addHandler(console_handler)
 
-feeds = [
+
+def configure_logging(verbose: int = 0) -> None:
+    """
+    Sends log records to a timestamped file in logs/ and to the console.
+
+    The threshold is WARNING by default, INFO at verbose=1 and DEBUG from
+    verbose=2, which adds a line for every skipped entry. File writes are
+    buffered in a MemoryHandler and flushed every 1024 records, on any
+    ERROR, and at exit.
+
+    Args:
+        verbose (int, optional): How many levels below WARNING to log.
+            Defaults to 0.
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(LOG_FILE, mode="a", encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(
+        MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+    )
+    if verbose >= 2:
+        root_logger.setLevel(logging.DEBUG)
+    elif verbose:
+        root_logger.setLevel(logging.INFO)
+    else:
+        root_logger.setLevel(logging.WARNING)
+    # Add console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    logger.addHandler(console_handler)
+
+
+feeds: Tuple[str, ...] = (
     # News & Science
     "https://rss.nytimes.com/services/xml/rss/nyt/Science.xml",
     "https://www.sciencedaily.com/rss/matter_energy/nuclear_energy.xml",
@@ -98,9 +130,11 @@ feeds = [
     "https://www.iaea.org/rss/news.xml",
     "https://thebulletin.org/search-feed",
     "https://carnegieendowment.org/feed/proliferation-news",
-]
+)
+# Drop accidental repeats, keeping order, so no feed is fetched twice.
+feeds = tuple(dict.fromkeys(feeds))
 
-keywords = [
+keywords = (
     # Core nuclear terms
     "nuclear",
     "LPO",
@@ -152,49 +186,280 @@ keywords = [
     "fusion ignition",
     "neutrino",
     "synchrotron",
-]
+)
+
+# All keywords compiled into one pattern so a text is scanned in a single
+# C-level pass instead of one substring search per keyword. The pattern is
+# a lookahead, so every position can report a match, over two groups:
+# - ordinary keywords, inside an inline (?i:...) group so they match in any
+#   case and anywhere in a word without lowercasing a copy of the text;
+# - uppercase acronyms, matched case-sensitively between word boundaries,
+#   so "DOE" and "START" match the agency and the treaty but not "does" or
+#   "restart".
+# Within each group longer keywords are tried first, so "nuclear waste"
+# wins over its own prefix "nuclear". _KEYWORDS_LC maps hits back to tags.
+_ACRONYMS = tuple(k for k in keywords if k.isupper())
+_KEYWORDS_LC = tuple(k.lower() for k in keywords)
+_KEYWORD_RE = re.compile(
+    r"(?=((?i:%s)|\b(?:%s)\b))"
+    % tuple(
+        "|".join(sorted(map(re.escape, group), key=len, reverse=True))
+        for group in (
+            [k for k in keywords if k not in _ACRONYMS],
+            _ACRONYMS,
+        )
+    )
+)
+
+# Browser-like headers; some feeds reject the default requests User-Agent.
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+    ),
+    # gzip, deflate, and br/zstd via the brotli and zstandard dependencies;
+    # urllib3 only advertises the encodings it can decode.
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+    "Referer": "https://www.google.com/",
+    "DNT": "1",
+}
+
+# One pooled session shared by all fetches so keep-alive connections (and
+# their TLS handshakes) are reused, with a small retry budget for
+# transient server errors and rate limiting. Retry-After is ignored: a
+# server asking for minutes or hours would otherwise stall the worker (and
+# the run, which waits for every feed) inside the retry loop; the short
+# backoff is used instead and the feed is simply retried next run.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=False,
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Stop reading a feed after this many consecutive entries older than the
+# window; most feeds list their newest entries first.
+OLD_ENTRY_LIMIT = 5
+
+# Feeds whose entries are not in date order and must always be read in
+# full.
+UNSORTED_FEEDS: frozenset = frozenset()
+
+# Azure Search accepts up to 1000 documents per request; stay well below
+# that to bound the request size. The buffered sender starts from this
+# batch size and halves it if the service rejects a request as too large.
+UPLOAD_BATCH_SIZE = 500
+
+# Seconds the buffered sender waits before flushing a partial batch.
+UPLOAD_FLUSH_INTERVAL = 60
+
+# Feed summaries shorter than this (as plain text) that are pure ASCII are
+# taken to be short English blurbs and indexed as-is without an OpenAI call.
+SHORT_SUMMARY_CHARS = 500
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Articles summarized per chat completion, the cap on the article text in
+# one such request (about 6000 prompt tokens at four characters per token),
+# and the instructions for it; the articles follow, numbered from 0.
+SUMMARY_BATCH_SIZE = 8
+SUMMARY_BATCH_CHARS = 24000
+SUMMARY_BATCH_PROMPT = (
+    "Translate each article below to English (if not already), then "
+    "summarize it. Reply with a JSON object of the form "
+    '{"summaries": [{"id": <article number>, "summary": "<summary>"}]} '
+    "holding one item per article."
+)
+
+# Tokens reserved for each summary reply when rate limiting OpenAI calls;
+# a prompt is estimated at four characters per token.
+SUMMARY_TOKEN_ALLOWANCE = 300
+
+
+def load_feed_cache(path: str) -> dict:
+    """
+    Loads the per-feed conditional GET cache written by a previous run.
+
+    Args:
+        path (str): Path of the JSON cache file.
+
+    Returns:
+        dict: Mapping of feed URL to its cached ETag, Last-Modified and body
+            hash. Empty if the file is missing or unreadable.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.info("No usable feed cache at %s: %s", path, e)
+        return {}
+
+
+def save_feed_cache(cache: dict, path: str) -> None:
+    """
+    Writes the per-feed conditional GET cache for the next run.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+
+
+def forget_unindexed_feeds(
+    cache: dict, candidate_links_by_feed: dict, indexed_urls: set
+) -> None:
+    """
+    Drops the cache entries of feeds with a candidate that was not indexed.
+
+    A cached ETag or body hash makes the next run skip the whole feed, so a
+    candidate whose summary or upload failed would never be retried. Without
+    the entry the feed is fetched and filtered in full again next run.
+
+    Args:
+        cache (dict): Conditional GET cache keyed by feed URL.
+        candidate_links_by_feed (dict): Candidate entry links per feed URL.
+        indexed_urls (set): Links of the documents indexed this run.
+    """
+    for url, links in candidate_links_by_feed.items():
+        if any(link not in indexed_urls for link in links):
+            logger.info("Not caching feed with unindexed entries: %s", url)
+            cache.pop(url, None)
+
+
+def read_body_with_deadline(resp: requests.Response, deadline: float) -> bytes:
+    """
+    Reads a streamed response body, decompressed, failing once the
+    time.monotonic() deadline has passed.
+
+    Raises:
+        TimeoutError: If the body is not fully read before the deadline.
+    """
+    chunks = []
+    # read1() returns whatever has arrived instead of blocking for a full
+    # chunk, so the deadline is checked as data trickles in.
+    while chunk := resp.raw.read1(1 << 16, decode_content=True):
+        chunks.append(chunk)
+        if time.monotonic() > deadline:
+            raise TimeoutError("feed download exceeded its time budget")
+    return b"".join(chunks)
 
 
 def fetch_feed_with_timeout(
-    url: str, timeout: int = 10
-) -> Optional[feedparser.FeedParserDict]:
+    url: str, timeout: int = 10, cache: Optional[dict] = None
+) -> Tuple[str, Optional[feedparser.FeedParserDict]]:
     """
-    Fetches and parses an RSS/Atom feed from the given URL with a timeout and
-    browser-like headers.
+    Fetches and parses an RSS/Atom feed from the given URL with a timeout,
+    using the shared browser-like session.
+
+    When a cache is given, the request is made conditional on the ETag and
+    Last-Modified values from the previous run, and a feed whose body is
+    byte-for-byte unchanged is skipped even if the server ignores those
+    headers. The cache is updated in place.
 
     Args:
         url (str): The URL of the RSS/Atom feed.
-        timeout (int, optional): Timeout in seconds for the HTTP request.
-            Defaults to 10.
+        timeout (int, optional): Timeout in seconds for connecting and for
+            each socket read, and the budget for the whole download counted
+            from the start of the call. The session's two retries (short
+            backoff, Retry-After ignored) can stretch a failing request
+            somewhat past it. Defaults to 10.
+        cache (dict, optional): Conditional GET cache keyed by feed URL.
 
     Returns:
-        feedparser.FeedParserDict or None: Parsed feed object, or None if
-            fetch fails.
-    """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.0.0 Safari/537.36"
-        ),
-        "Accept": (
-            "text/html,application/xhtml+xml,application/xml;"
-            "q=0.9,*/*;q=0.8"
-        ),
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-        "Referer": "https://www.google.com/",
-        "DNT": "1",
-    }
+        tuple: The feed URL and the parsed feed object, or None in place of
+            the feed if the fetch fails or the feed has not changed.
+    """
+    cached = cache.get(url, {}) if cache is not None else {}
+    conditional_headers = {}
+    if cached.get("etag"):
+        conditional_headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        conditional_headers["If-Modified-Since"] = cached["last_modified"]
+    # requests' timeout only bounds each socket operation; the deadline
+    # caps the body download so a slow-dripping server cannot hold a
+    # worker much longer than `timeout` seconds after the call started.
+    deadline = time.monotonic() + timeout
     try:
-        resp = requests.get(url, timeout=timeout, headers=headers)
-        resp.raise_for_status()
-        logger.info(f"Fetched feed: {url}")
-        return feedparser.parse(resp.content)
+        with _SESSION.get(
+            url, timeout=timeout, stream=True, headers=conditional_headers
+        ) as resp:
+            if resp.status_code == 304:
+                logger.info("Feed not modified: %s", url)
+                return url, None
+            resp.raise_for_status()
+            body = read_body_with_deadline(resp, deadline)
+            logger.info("Fetched feed: %s", url)
+            if cache is not None:
+                body_sha = hashlib.sha256(body).hexdigest()
+                cache[url] = {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "body_sha": body_sha,
+                }
+                if cached.get("body_sha") == body_sha:
+                    logger.info("Feed unchanged since last run: %s", url)
+                    return url, None
+            # Skip feedparser's URI-resolution pass: relative links in
+            # entry bodies are deliberately left as-is, including in the
+            # summary HTML indexed as "content", since nothing downstream
+            # follows them. HTML sanitizing stays on because that content
+            # is indexed.
+            return url, feedparser.parse(body, resolve_relative_uris=False)
     except Exception as e:
-        logger.warning(f"Failed to fetch {url}  ̲ {e}")
-        return None
+        logger.warning("Failed to fetch %s  ̲ %s", url, e)
+        return url, None
+
+
+def fetch_feeds(
+    urls: Iterable[str], max_workers: int = 8, cache: Optional[dict] = None
+) -> Iterator[Tuple[str, Optional[feedparser.FeedParserDict]]]:
+    """
+    Fetches feeds concurrently on a bounded thread pool.
+
+    Fetching is network-bound, so running the requests in parallel brings
+    the fetch phase down to roughly the slowest host instead of the sum of
+    all feeds. Feeds on the same host are fetched one after another by a
+    single worker so they share one keep-alive connection (and one TLS
+    handshake) instead of each opening their own. Results are yielded in
+    completion order so the caller can process them on the calling thread
+    as soon as they arrive.
+
+    Args:
+        urls (Iterable[str]): Feed URLs to fetch.
+        max_workers (int, optional): Maximum number of concurrent fetches.
+            Defaults to 8.
+        cache (dict, optional): Conditional GET cache passed to
+            fetch_feed_with_timeout.
+
+    Yields:
+        tuple: The feed URL and the parsed feed object (or None on failure).
+    """
+    urls_by_host: dict = {}
+    for url in urls:
+        urls_by_host.setdefault(urlsplit(url).netloc, []).append(url)
+
+    def fetch_host(host_urls: list) -> list:
+        return [fetch_feed_with_timeout(u, cache=cache) for u in host_urls]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(fetch_host, host_urls)
+            for host_urls in urls_by_host.values()
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
 
 
 def matches_keywords(text: str) -> bool:
@@ -208,53 +473,98 @@ def matches_keywords(text: str) -> bool:
     Returns:
         bool: True if any keyword is found, False otherwise.
     """
-    text = text.lower()
-    return any(k in text for k in keywords)
+    return _KEYWORD_RE.search(text) is not None
+
+
+def find_keywords(text: str) -> list:
+    """
+    Returns the keywords that occur in the provided text, in keyword order.
+    The list is empty (falsy) when nothing matches, so one call serves both
+    as the keyword filter and as the source of a document's tags.
+
+    Args:
+        text (str): The text to search for keywords.
+
+    Returns:
+        list: Every keyword found in the text.
+    """
+    found = {m.lower() for m in _KEYWORD_RE.findall(text)}
+    # A keyword hidden behind a longer match at the same position (e.g.
+    # "nuclear" inside "nuclear waste") is a substring of that match.
+    return [
+        k
+        for k, k_lc in zip(keywords, _KEYWORDS_LC)
+        if any(k_lc in m for m in found)
+    ]
 
 
 def process_feed(
     url: str,
+    feed: Optional[feedparser.FeedParserDict],
     one_week_ago: datetime,
-    existing_urls: set,
-    ws,
-    keywords: list,
-    client,
-    model_name: str,
-    search_client,
+    existing_urls: Union[set, "SeenUrls"],
+    candidates: list,
     logger,
+    now: Optional[datetime] = None,
 ) -> None:
     """
-    Process a single RSS feed: fetch, filter, summarize, upload, and log
-    articles.
+    Process a single fetched RSS feed: filter its entries and collect the
+    ones to summarize.
     """
-    logger.info(f"Parsing feed: {url}")
-    feed = fetch_feed_with_timeout(url)
+    logger.info("Parsing feed: %s", url)
     if not feed:
         return
-    logger.info(f"Found {len(feed.entries)} entries.")
+    logger.info("Found %d entries.", len(feed.entries))
+    # In a newest-first feed everything after the first old entry is old
+    # too. Feeds that are only roughly ordered are cut off after a run of
+    # OLD_ENTRY_LIMIT old entries unless listed in UNSORTED_FEEDS.
+    if is_newest_first(feed.entries):
+        old_entry_limit = 1
+    elif url in UNSORTED_FEEDS:
+        old_entry_limit = 0
+    else:
+        old_entry_limit = OLD_ENTRY_LIMIT
+    consecutive_old = 0
     for entry in feed.entries:
-        process_entry(
-            entry,
-            feed,
-            one_week_ago,
-            existing_urls,
-            ws,
-            keywords,
-            client,
-            model_name,
-            search_client,
-            logger,
-        )
+        if not is_entry_recent(entry, one_week_ago, logger, now):
+            consecutive_old += 1
+            if consecutive_old == old_entry_limit:
+                logger.info(
+                    "Remaining entries are outside the window: %s", url
+                )
+                break
+            continue
+        consecutive_old = 0
+        process_entry(entry, feed, existing_urls, candidates, logger)
+
+
+def is_newest_first(entries: list) -> bool:
+    """
+    Returns True if every entry has a parsed publish date and the entries
+    are ordered newest first.
+
+    The check compares feedparser's time tuples directly, which is much
+    cheaper than building a datetime for every entry.
+    """
+    dates = [entry.get("published_parsed") for entry in entries]
+    if not all(dates):
+        return False
+    return all(a >= b for a, b in zip(dates, dates[1:]))
 
 
-def is_entry_recent(entry, one_week_ago: datetime, logger) -> bool:
+def is_entry_recent(
+    entry, one_week_ago: datetime, logger, now: Optional[datetime] = None
+) -> bool:
     """
     Returns True if the entry is recent (published within the last week),
     else False.
-    Logs and handles parsing errors gracefully.
+    Logs and handles parsing errors gracefully. Entries without a usable
+    date count as published at `now` (the run's start time when given).
     """
+    if now is None:
+        now = datetime.now(timezone.utc)
     try:
-        published_dt = extract_published_dt(entry)
+        published_dt = extract_published_dt(entry, now)
     except Exception as e:
         title = getattr(entry, "title", entry.get("title", ""))
         logger.warning(
@@ -265,33 +575,116 @@ def is_entry_recent(entry, one_week_ago: datetime, logger) -> bool:
             "error: %s",
             e,
         )
-        published_dt = datetime.now(timezone.utc)
+        published_dt = now
     if published_dt < one_week_ago:
-        msg = "Skipping old article: %s" % getattr(
-            entry, "title", entry.get("title", "")
+        logger.debug(
+            "Skipping old article: %s",
+            getattr(entry, "title", entry.get("title", "")),
         )
-        logger.info(msg)
         return False
     return True
 
 
-def is_entry_duplicate(entry, existing_urls: set, logger) -> bool:
+def is_entry_duplicate(
+    entry, existing_urls: Union[set, "SeenUrls"], logger
+) -> bool:
     if entry.link in existing_urls:
-        logger.info(f"Skipping duplicate URL: {entry.title}")
+        logger.debug("Skipping duplicate URL: %s", entry.title)
         return True
     return False
 
 
-def get_entry_summary(entry, client, model_name: str, logger) -> str:
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces calls to a per-minute budget.
+
+    The bucket holds at most one minute's worth of tokens and refills
+    continuously, so bursts are allowed up to the budget and sustained use
+    settles at the budget instead of tripping the service's throttling.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: float,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ) -> None:
+        self.capacity = tokens_per_minute
+        self._rate = tokens_per_minute / 60.0
+        self._tokens = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, weight: float = 1) -> None:
+        """
+        Blocks until `weight` tokens are available, then takes them. A
+        weight above the capacity waits for a full bucket.
+        """
+        weight = min(weight, self.capacity)
+        # Waiters sleep while holding the lock so they are served in turn
+        # instead of racing for each refill.
+        with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                self._sleep((weight - self._tokens) / self._rate)
+
+
+def plain_text(markup: str) -> str:
+    """
+    Strips tags and entities from a feed's HTML summary and collapses
+    whitespace.
+    """
+    return " ".join(html.unescape(_TAG_RE.sub(" ", markup)).split())
+
+
+def short_english_summary(entry) -> Optional[str]:
+    """
+    Returns an entry's summary as plain text when it is short and pure
+    ASCII, otherwise None.
+
+    A blurb of a sentence or two in plain ASCII is already an English
+    summary; sending it to the model would cost a request for no gain.
+    """
+    text = plain_text(entry.get("summary", ""))
+    if len(text) < SHORT_SUMMARY_CHARS and text.isascii():
+        return text
+    return None
+
+
+def get_entry_summary(
+    entry,
+    client,
+    model_name: str,
+    logger,
+    limiter: Optional[TokenBucket] = None,
+) -> str:
     content = entry.get("summary", "")
     if not content:
         logger.warning("No summary available in RSS feed.")
         return ""
+    text = short_english_summary(entry)
+    if text is not None:
+        logger.info("Using the feed's own summary for: %s", entry.title)
+        return text
     try:
         translation_prompt = (
             "Translate this to English (if not already), then summarize:\n"
             f"{content[:4000]}"
         )
+        if limiter is not None:
+            limiter.acquire(
+                len(translation_prompt) // 4 + SUMMARY_TOKEN_ALLOWANCE
+            )
         logger.info(
             "Sending translation + summary request to OpenAI for: %s",
             entry.title,
@@ -302,169 +695,595 @@ def get_entry_summary(entry, client, model_name: str, logger) -> str:
             temperature=0.3,
         )
         summary = response.choices[0].message.content.strip()
-        logger.info(f"Got summary for: {entry.title}")
+        logger.info("Got summary for: %s", entry.title)
         return summary
     except Exception as e:
-        logger.error(f"Error summarizing article: {e}")
+        logger.error("Error summarizing article: %s", e)
         return ""
 
 
-def upload_entry_to_search(doc: dict, search_client, logger) -> bool:
-    try:
-        result = search_client.upload_documents(documents=[doc])
-        status = (
-            result[0].status_code
-            if hasattr(result[0], "status_code")
-            else "Success"
+def parse_batch_summaries(items: list, ids: set) -> dict:
+    """
+    Maps article numbers to summaries from a batched reply, skipping any
+    item with an unknown id or without a non-empty string summary so one
+    bad item does not discard the rest.
+    """
+    by_id: dict = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        summary = item.get("summary")
+        if not isinstance(summary, str) or not summary.strip():
+            continue
+        try:
+            article_id = int(item["id"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if article_id in ids:
+            by_id[article_id] = summary.strip()
+    return by_id
+
+
+def summarize_batch(
+    entries: list,
+    client,
+    model_name: str,
+    logger,
+    limiter: Optional[TokenBucket] = None,
+) -> list:
+    """
+    Summarizes several entries with a single chat completion.
+
+    The articles are numbered in one prompt and the model replies with a
+    JSON object mapping each number to its summary, so a batch costs one
+    round trip instead of one per article. Entries that do not need the
+    model, and any the reply leaves out or garbles, go through
+    get_entry_summary() one at a time.
+
+    Returns:
+        list: One summary per entry, in the same order; empty strings mark
+            entries that could not be summarized.
+    """
+    numbered = [
+        (i, entry)
+        for i, entry in enumerate(entries)
+        if entry.get("summary") and short_english_summary(entry) is None
+    ]
+    by_id: dict = {}
+    if len(numbered) > 1:
+        prompt = SUMMARY_BATCH_PROMPT + "".join(
+            "\n\nArticle %d:\n%s" % (i, entry.get("summary")[:4000])
+            for i, entry in numbered
         )
-        logger.info("Uploaded: %s Status: %s", doc["title"], status)
-        return True
+        try:
+            if limiter is not None:
+                limiter.acquire(
+                    len(prompt) // 4 + SUMMARY_TOKEN_ALLOWANCE * len(numbered)
+                )
+            logger.info(
+                "Sending batched summary request to OpenAI for %d articles.",
+                len(numbered),
+            )
+            response = client.chat.completions.create(
+                model=model_name,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
+            reply = json.loads(response.choices[0].message.content)
+            by_id = parse_batch_summaries(
+                reply["summaries"], {i for i, _ in numbered}
+            )
+        except Exception as e:
+            logger.warning(
+                "Batched summary failed, summarizing one by one: %s", e
+            )
+    return [
+        by_id.get(i)
+        or get_entry_summary(entry, client, model_name, logger, limiter)
+        for i, entry in enumerate(entries)
+    ]
+
+
+def summarize_entries(
+    entries: list,
+    client,
+    model_name: str,
+    logger,
+    max_workers: int = 8,
+    limiter: Optional[TokenBucket] = None,
+    cache: Optional[sqlite3.Connection] = None,
+) -> list:
+    """
+    Summarizes entries in batches of up to SUMMARY_BATCH_SIZE articles and
+    SUMMARY_BATCH_CHARS of article text, running the batches concurrently
+    on a bounded thread pool.
+
+    Each batch is an independent, multi-second OpenAI request, so running
+    them in parallel brings the phase down from the sum of the calls to
+    roughly their total divided by max_workers. The OpenAI client is
+    thread-safe and retries throttled (429) requests itself.
+
+    With a cache, entries whose summary text was already summarized (in
+    this or an earlier run) reuse that summary; the cache is only read and
+    written on the calling thread.
+
+    Args:
+        entries (list): Feed entries to summarize.
+        client (AzureOpenAI): OpenAI client.
+        model_name (str): OpenAI deployment name.
+        logger (logging.Logger): Logger for progress and errors.
+        max_workers (int, optional): Maximum number of concurrent requests.
+            Defaults to 8.
+        limiter (TokenBucket, optional): Shared tokens-per-minute budget
+            each request draws its estimated token count from.
+        cache (sqlite3.Connection, optional): Summary cache opened with
+            open_summary_cache().
+
+    Returns:
+        list: One summary per entry, in the same order; empty strings mark
+            entries that could not be summarized.
+    """
+    keys = [summary_cache_key(entry) for entry in entries]
+    summaries = lookup_summaries(cache, keys) if cache is not None else {}
+    # Reposted stories share a body: summarize each distinct body once.
+    pending: dict = {}
+    for key, entry in zip(keys, entries):
+        if key not in summaries:
+            pending.setdefault(key, entry)
+    logger.info(
+        "Requesting %d summaries for %d entries.",
+        len(pending),
+        len(entries),
+    )
+    batches: list = []
+    batch_chars = 0
+    for entry in pending.values():
+        size = len(entry.get("summary", "")[:4000])
+        if (
+            not batches
+            or len(batches[-1]) == SUMMARY_BATCH_SIZE
+            or batch_chars + size > SUMMARY_BATCH_CHARS
+        ):
+            batches.append([])
+            batch_chars = 0
+        batches[-1].append(entry)
+        batch_chars += size
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda batch: summarize_batch(
+                batch, client, model_name, logger, limiter
+            ),
+            batches,
+        )
+        fresh = dict(
+            zip(pending, (summary for batch in results for summary in batch))
+        )
+    if cache is not None:
+        store_summaries(cache, fresh)
+    summaries.update(fresh)
+    return [summaries[key] for key in keys]
+
+
+def summary_cache_key(entry) -> str:
+    """
+    Returns the hash of the part of an entry's summary the model sees.
+    """
+    content = entry.get("summary", "")[:4000]
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def open_summary_cache(path: str) -> sqlite3.Connection:
+    """
+    Opens (creating if needed) the SQLite cache of summaries keyed by
+    summary_cache_key().
+    """
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS summaries "
+        "(key TEXT PRIMARY KEY, summary TEXT NOT NULL)"
+    )
+    return conn
+
+
+def lookup_summaries(conn: sqlite3.Connection, keys: Iterable[str]) -> dict:
+    """
+    Returns the cached summaries for the given keys, keyed by cache key.
+    """
+    found = {}
+    for key in set(keys):
+        row = conn.execute(
+            "SELECT summary FROM summaries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            found[key] = row[0]
+    return found
+
+
+def store_summaries(conn: sqlite3.Connection, summaries: dict) -> None:
+    """
+    Caches summaries by key; empty summaries (failed requests) are skipped
+    so they are retried next run.
+    """
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO summaries (key, summary) VALUES (?, ?)",
+            ((key, text) for key, text in summaries.items() if text),
+        )
+
+
+def action_document(action) -> Any:
+    """
+    Returns the document fields of a buffered sender's IndexAction.
+
+    azure-search-documents 11.x passes an msrest model holding the fields
+    in additional_properties; 12.x passes a mapping of the fields itself.
+    """
+    return getattr(action, "additional_properties", None) or action
+
+
+def index_documents(
+    docs: list, ws, open_search_sender, upload_log: TextIO, logger
+) -> list:
+    """
+    Uploads documents through a SearchIndexingBufferedSender, then records
+    the accepted ones in the worksheet and, one JSON object per line, in
+    the upload log.
+
+    The sender groups the uploads into batches and retries throttled
+    documents itself; its callbacks report which documents the service
+    finally accepted.
+
+    Args:
+        docs (list): Documents to upload.
+        ws (Worksheet): Worksheet receiving one row per accepted document.
+        open_search_sender (callable): Creates the buffered sender; takes
+            the on_progress and on_error callbacks as keyword arguments.
+        upload_log (TextIO): Upload log receiving accepted documents.
+        logger (logging.Logger): Logger for upload results.
+
+    Returns:
+        list: The documents the service accepted, in upload order.
+    """
+    worksheet = get_worksheet(ws)
+    accepted_ids = set()
+
+    # Callbacks may run on the sender's auto-flush timer thread; set.add is
+    # atomic, so the shared set needs no lock.
+    def on_progress(action) -> None:
+        doc = action_document(action)
+        accepted_ids.add(doc.get("id"))
+        logger.info("Uploaded: %s", doc.get("title"))
+
+    def on_error(action) -> None:
+        logger.error(
+            "Failed to upload: %s", action_document(action).get("title")
+        )
+
+    try:
+        with open_search_sender(
+            on_progress=on_progress, on_error=on_error
+        ) as sender:
+            sender.upload_documents(documents=docs)
     except Exception as e:
-        logger.error(f"Error uploading to Azure Search: {e}")
-        return False
+        logger.error("Error uploading to Azure Search: %s", e)
+    indexed = [doc for doc in docs if doc["id"] in accepted_ids]
+    for doc in indexed:
+        worksheet.append(
+            [
+                doc["title"],
+                doc["summary"],
+                doc["url"],
+                doc["author"],
+                ", ".join(doc["tags"]),
+                doc["publishedDate"],
+                doc["source"],
+            ]
+        )
+    upload_log.writelines(
+        json.dumps(doc, separators=(",", ":")) + "\n" for doc in indexed
+    )
+    return indexed
 
 
-def extract_published_dt(entry) -> datetime:
+def extract_published_dt(entry, now: Optional[datetime] = None) -> datetime:
     """
     Extracts and returns a timezone-aware published datetime from an RSS entry.
-    Falls back to current UTC time if parsing fails.
+    Falls back to `now` (current UTC time by default) if parsing fails.
+
+    feedparser has already parsed the date string into a UTC time tuple, so
+    the datetime is built straight from that tuple; re-parsing the string
+    (e.g. with email.utils) would be several times slower.
     """
-    published_str = entry.get("published", None)
-    if not published_str:
-        return datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if not entry.get("published", None):
+        return now
     published_parsed = getattr(entry, "published_parsed", None)
-    try:
-        if not published_parsed:
-            return datetime.now(timezone.utc)
-        if isinstance(published_parsed, datetime):
-            published_dt = published_parsed
-        elif isinstance(published_parsed, tuple):
-            if len(published_parsed) == 6:
-                published_dt = datetime(*published_parsed, tzinfo=timezone.utc)
-            elif len(published_parsed) > 6:
-                published_dt = datetime(*published_parsed[:6])
-            else:
-                published_dt = datetime.now(timezone.utc)
-        else:
-            published_dt = datetime.now(timezone.utc)
+    if isinstance(published_parsed, datetime):
         # Ensure timezone-aware (UTC)
-        if (
-            published_dt.tzinfo is None
-            or published_dt.tzinfo.utcoffset(published_dt) is None
-        ):
-            published_dt = published_dt.replace(tzinfo=timezone.utc)
+        if published_parsed.utcoffset() is None:
+            return published_parsed.replace(tzinfo=timezone.utc)
+        return published_parsed
+    if not isinstance(published_parsed, tuple) or len(published_parsed) < 6:
+        return now
+    year, month, day, hour, minute, second = published_parsed[:6]
+    try:
+        return datetime(
+            year, month, day, hour, minute, second, tzinfo=timezone.utc
+        )
     except (TypeError, ValueError):
-        published_dt = datetime.now(timezone.utc)
-    return published_dt
+        return now
 
 
-def process_entry(
-    entry,
-    feed,
-    one_week_ago: datetime,
-    existing_urls: set,
-    ws,
-    keywords: list,
-    client,
-    model_name: str,
-    search_client,
-    logger,
-) -> None:
+def document_id(url: str) -> str:
     """
-    Process a single feed entry: filter, summarize, upload, and log.
+    Returns a deterministic search document key for an article URL.
+
+    Re-indexing the same article overwrites its existing document instead
+    of adding a duplicate, and BLAKE2 hashing avoids a urandom syscall per
+    document.
+    """
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def build_document(
+    entry, feed, summary: str, tags: list, now: Optional[datetime] = None
+) -> dict:
+    """
+    Builds the Azure Search document for a summarized feed entry.
     """
-    if not is_entry_recent(entry, one_week_ago, logger):
-        return
-    combined_text = entry.title + " " + entry.get("summary", "")
-    if not matches_keywords(combined_text):
-        logger.info(f"Skipping (no keyword match): {entry.title}")
-        return
-    if is_entry_duplicate(entry, existing_urls, logger):
-        return
-    summary = get_entry_summary(entry, client, model_name, logger)
-    if not summary:
-        return
     content = entry.get("summary", "")
-    published_dt = extract_published_dt(entry)
-    doc = {
-        "id": str(uuid.uuid4()),
+    published_dt = extract_published_dt(entry, now)
+    return {
+        "id": document_id(entry.link),
         "title": entry.title,
         "summary": summary,
         "url": entry.link,
         "author": entry.get("author", "Unknown"),
-        "tags": [k for k in keywords if k in content.lower()],
+        "tags": tags,
         "publishedDate": published_dt.isoformat(),
         "source": feed.feed.get("title", "RSS Source"),
         "content": content[:8000],
     }
-    if not upload_entry_to_search(doc, search_client, logger):
+
+
+def process_entry(
+    entry,
+    feed,
+    existing_urls: Union[set, "SeenUrls"],
+    candidates: list,
+    logger,
+) -> None:
+    """
+    Process a single recent feed entry: filter it and, if it qualifies,
+    collect it with its feed and tags for summarization.
+    """
+    # Cheapest check first: a primary-key lookup on the link.
+    if is_entry_duplicate(entry, existing_urls, logger):
         return
-    if ws is None:
-        raise RuntimeError("Worksheet is None")
-    worksheet = get_worksheet(ws)
-    worksheet.append(
-        [
-            doc["title"],
-            summary,
-            doc["url"],
-            doc["author"],
-            ", ".join(doc["tags"]),
-            doc["publishedDate"],
-            doc["source"],
-        ]
-    )
-    existing_urls.add(doc["url"])
-    with open("upload.log", "a", encoding="utf-8") as logf:
-        logf.write(json.dumps(doc, indent=2) + "\n\n")
+    # The summary's keyword hits double as the document tags, so they are
+    # found once here and carried with the candidate. The title is only
+    # scanned when the summary has no hits.
+    tags = find_keywords(entry.get("summary", ""))
+    if not (tags or matches_keywords(entry.title)):
+        logger.debug("Skipping (no keyword match): %s", entry.title)
+        return
+    # An entry with no summary text is never indexed; as a candidate it
+    # would make forget_unindexed_feeds() drop its feed's cache every run.
+    if not plain_text(entry.get("summary", "")):
+        logger.debug("Skipping (no summary text): %s", entry.title)
+        return
+    existing_urls.add(entry.link)
+    candidates.append((entry, feed, tags))
 
 
 def get_azure_clients_and_secrets():
     """
     Lazily fetch Azure secrets and instantiate clients.
-    Call only inside main().
+    Called by summarize_and_index(), so only runs with candidates to
+    summarize pay for the SDK imports and Key Vault lookups.
     Returns:
         client (AzureOpenAI): OpenAI client
         model_name (str): OpenAI deployment name
-        search_client (SearchClient): Azure Search client
+        open_search_sender (callable): Creates a
+            SearchIndexingBufferedSender for the news index; extra keyword
+            arguments are passed through to it.
     """
+    # The Azure and OpenAI SDKs take most of the module's import time, so
+    # they are imported here, only on runs that have something to process.
+    from azure.core.credentials import AzureKeyCredential
+    from azure.identity import DefaultAzureCredential
+    from azure.keyvault.secrets import SecretClient
+    from azure.search.documents import SearchIndexingBufferedSender
+    from openai import AzureOpenAI
+
     key_vault_url = os.getenv("KEY_VAULT_URL")
     credential = DefaultAzureCredential()
     secret_client = SecretClient(
         vault_url=key_vault_url, credential=credential
     )
+    # The first lookup runs alone so the credential acquires and caches its
+    # token once; the remaining independent lookups then run in parallel.
     openai_api_key = secret_client.get_secret("AI-OPENAI-KEY").value
-    openai_api_base = secret_client.get_secret("AI-OPENAI-ENDPOINT").value
-    openai_deployment = secret_client.get_secret("AI-OPENAI-DEPLOYMENT").value
-    search_api_key = secret_client.get_secret("AI-SEARCH-PRIMARY-KEY").value
-    search_api_endpoint = secret_client.get_secret("AI-SEARCH-ENDPOINT").value
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        (
+            openai_api_base,
+            openai_deployment,
+            search_api_key,
+            search_api_endpoint,
+        ) = executor.map(
+            lambda name: secret_client.get_secret(name).value,
+            [
+                "AI-OPENAI-ENDPOINT",
+                "AI-OPENAI-DEPLOYMENT",
+                "AI-SEARCH-PRIMARY-KEY",
+                "AI-SEARCH-ENDPOINT",
+            ],
+        )
     client = AzureOpenAI(
         api_key=openai_api_key,
         api_version="2024-12-01-preview",
         azure_endpoint=openai_api_base,
+        # Summaries run concurrently; let the SDK back off and retry
+        # throttled (429) requests instead of dropping the article.
+        max_retries=5,
     )
     model_name = openai_deployment
-    search_client = SearchClient(
+    open_search_sender = partial(
+        SearchIndexingBufferedSender,
         endpoint=search_api_endpoint,
         index_name="news-articles-index",
         credential=AzureKeyCredential(search_api_key),
+        auto_flush_interval=UPLOAD_FLUSH_INTERVAL,
+        initial_batch_action_count=UPLOAD_BATCH_SIZE,
     )
-    return client, model_name, search_client
+    return client, model_name, open_search_sender
 
 
-def get_worksheet(ws: Any) -> Worksheet:
-    if ws is None or not isinstance(ws, Worksheet):
+def get_worksheet(ws: Any) -> Union[Worksheet, WriteOnlyWorksheet]:
+    if ws is None or not isinstance(ws, (Worksheet, WriteOnlyWorksheet)):
         raise RuntimeError("Worksheet is None or not a Worksheet instance")
     return ws
 
 
-def main() -> None:
+def open_seen_urls_db(path: str) -> sqlite3.Connection:
+    """
+    Opens (creating if needed) the SQLite store of already indexed URLs.
+
+    The store replaces reading the URL column back out of an Excel file:
+    lookups use the primary-key index and new URLs are appended without
+    rewriting any history.
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY)")
+    return conn
+
+
+class SeenUrls:
+    """
+    Set-like view of the seen-URL store for duplicate checks.
+
+    Membership is answered by a primary-key lookup per URL instead of
+    loading the whole history, so startup cost does not grow with the
+    store. URLs added during the run are kept in memory only; the ones
+    that end up indexed are persisted with record_seen_urls().
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._added: set = set()
+
+    def __contains__(self, url: object) -> bool:
+        if url in self._added:
+            return True
+        row = self._conn.execute(
+            "SELECT 1 FROM seen WHERE url = ?", (url,)
+        ).fetchone()
+        return row is not None
+
+    def add(self, url: str) -> None:
+        self._added.add(url)
+
+
+def record_seen_urls(conn: sqlite3.Connection, urls: Iterable[str]) -> None:
+    """
+    Adds URLs to the seen-URL store, ignoring ones already present.
+    """
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO seen (url) VALUES (?)",
+            ((url,) for url in urls),
+        )
+
+
+def summarize_and_index(
+    candidates: list,
+    worksheet,
+    output_dir: str,
+    now: datetime,
+    summary_workers: int = 8,
+    tokens_per_minute: Optional[int] = None,
+) -> list:
+    """
+    Summarizes the candidate entries and indexes the resulting documents.
+
+    Azure secrets and clients are only fetched here, so a run with no new
+    matching entries makes no Key Vault, OpenAI or Search calls.
+
+    Returns:
+        list: The documents the search service accepted.
+    """
+    client, model_name, open_search_sender = get_azure_clients_and_secrets()
+    logger.info("Summarizing %d matching entries.", len(candidates))
+    summary_cache = open_summary_cache(
+        os.path.join(output_dir, "summary_cache.db")
+    )
+    summaries = summarize_entries(
+        [entry for entry, _, _ in candidates],
+        client,
+        model_name,
+        logger,
+        max_workers=summary_workers,
+        limiter=(
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        ),
+        cache=summary_cache,
+    )
+    summary_cache.close()
+    docs = [
+        build_document(entry, feed, summary, tags, now)
+        for (entry, feed, tags), summary in zip(candidates, summaries)
+        if summary
+    ]
+    # upload.log is opened once for the run with a large write buffer.
+    with open(
+        "upload.log", "a", encoding="utf-8", buffering=1 << 16
+    ) as upload_log:
+        return index_documents(
+            docs, worksheet, open_search_sender, upload_log, logger
+        )
+
+
+def main(argv: Optional[list] = None) -> None:
     """
     Main execution function for fetching, filtering, summarizing, and indexing
     nuclear-related news articles.
     Handles feed parsing, keyword filtering, summarization, Azure Search
     upload, and Excel logging.
     """
-    client, model_name, search_client = get_azure_clients_and_secrets()
+    parser = argparse.ArgumentParser(
+        description="Fetch, summarize, and index nuclear-related news."
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="log progress at INFO level; repeat (-vv) to also log every "
+        "skipped entry (default: warnings and errors only)",
+    )
+    parser.add_argument(
+        "--summary-workers",
+        type=int,
+        default=8,
+        metavar="N",
+        help="concurrent OpenAI summary requests; size this to the "
+        "deployment's rate limit (default: 8)",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=int,
+        metavar="N",
+        help="pace summary requests to the deployment's tokens-per-minute "
+        "quota (default: no limit)",
+    )
+    args = parser.parse_args(argv)
+    if args.summary_workers < 1:
+        parser.error("--summary-workers must be at least 1")
+    if args.tokens_per_minute is not None and args.tokens_per_minute < 1:
+        parser.error("--tokens-per-minute must be at least 1")
+    configure_logging(args.verbose)
     output_dir = os.path.join(os.path.dirname(__file__), "output")
     os.makedirs(output_dir, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -478,32 +1297,54 @@ def main() -> None:
         "PublishedDate",
         "Source",
     ]
-    if not os.path.exists(excel_file):
-        wb = Workbook()
-        ws = wb.active
-        ws.append(headers)
-        wb.save(excel_file)
-    logger.info(f"Excel output saved to: {os.path.abspath(excel_file)}")
-    wb = load_workbook(excel_file)
-    worksheet = get_worksheet(wb.active)
-    existing_urls = {
-        row[2]
-        for row in worksheet.iter_rows(min_row=2, values_only=True)
-        if row[2]
-    }
-    one_week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    for url in feeds:
+    # A fresh write-only workbook per run streams rows to disk instead of
+    # keeping them in memory.
+    wb = Workbook(write_only=True)
+    worksheet = get_worksheet(wb.create_sheet())
+    worksheet.append(headers)
+    seen_urls_db = open_seen_urls_db(os.path.join(output_dir, "seen_urls.db"))
+    existing_urls = SeenUrls(seen_urls_db)
+    # One clock read per run: the window start and every fallback date
+    # derive from it.
+    now = datetime.now(timezone.utc)
+    one_week_ago = now - timedelta(days=7)
+    feed_cache_file = os.path.join(output_dir, "feed_cache.json")
+    feed_cache = load_feed_cache(feed_cache_file)
+    candidates: list = []
+    candidate_links_by_feed: dict = {}
+    # Feeds are fetched in parallel; entries are filtered on the main
+    # thread, the only one that touches the seen-URL connection.
+    for url, feed in fetch_feeds(feeds, cache=feed_cache):
+        start = len(candidates)
         process_feed(
             url,
+            feed,
             one_week_ago,
             existing_urls,
-            worksheet,
-            keywords,
-            client,
-            model_name,
-            search_client,
+            candidates,
             logger,
+            now,
         )
+        candidate_links_by_feed[url] = [
+            entry.link for entry, _, _ in candidates[start:]
+        ]
+    indexed = (
+        summarize_and_index(
+            candidates,
+            worksheet,
+            output_dir,
+            now,
+            summary_workers=args.summary_workers,
+            tokens_per_minute=args.tokens_per_minute,
+        )
+        if candidates
+        else []
+    )
+    indexed_urls = {doc["url"] for doc in indexed}
+    record_seen_urls(seen_urls_db, indexed_urls)
+    forget_unindexed_feeds(feed_cache, candidate_links_by_feed, indexed_urls)
+    seen_urls_db.close()
+    save_feed_cache(feed_cache, feed_cache_file)
     wb.save(excel_file)
     logger.info("Job complete.")
     logger.info(
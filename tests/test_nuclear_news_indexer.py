@@ -1,6 +1,34 @@
+import io
+import json
+import re
+import time
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta, timezone
-from nuclear_news_indexer import matches_keywords, is_entry_recent
+from azure.search.documents import IndexDocumentsBatch
+from openpyxl import Workbook
+from nuclear_news_indexer import (
+    SeenUrls,
+    TokenBucket,
+    document_id,
+    extract_published_dt,
+    fetch_feed_with_timeout,
+    find_keywords,
+    forget_unindexed_feeds,
+    get_entry_summary,
+    index_documents,
+    is_entry_recent,
+    is_newest_first,
+    matches_keywords,
+    open_summary_cache,
+    open_seen_urls_db,
+    process_entry,
+    process_feed,
+    read_body_with_deadline,
+    record_seen_urls,
+    summarize_batch,
+    summarize_entries,
+)
 
 class MockEntry(dict):
     def __getattr__(self, item):
@@ -16,10 +44,27 @@ class TestNuclearNewsIndexer(unittest.TestCase):
         text = "This article discusses nuclear fusion and reactors."
         self.assertTrue(matches_keywords(text))
 
+    def test_find_keywords_empty_without_match(self):
+        self.assertEqual(find_keywords("A story about gardening."), [])
+
     def test_matches_keywords_false(self):
         text = "This article is about gardening and plants."
         self.assertFalse(matches_keywords(text))
 
+    def test_find_keywords_includes_overlapping_keywords(self):
+        text = "Nuclear waste from the breeder reactor."
+        self.assertEqual(
+            find_keywords(text),
+            ["nuclear", "reactor", "breeder reactor", "nuclear waste"],
+        )
+
+    def test_find_keywords_matches_acronyms_as_capitalized_words(self):
+        self.assertEqual(
+            find_keywords("The NRC and DOE signed off on the START talks."),
+            ["DOE", "NRC", "START"],
+        )
+        self.assertEqual(find_keywords("Does it start on time?"), [])
+
     def test_is_entry_recent_true(self):
         entry = MockEntry({
             "published": datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S %z"),
@@ -41,14 +86,358 @@ class TestNuclearNewsIndexer(unittest.TestCase):
         # Should not be recent
         self.assertFalse(is_entry_recent(entry, one_week_ago, logger=DummyLogger()))
 
+    def test_document_id_is_stable_per_url(self):
+        first = document_id("https://a.example/story")
+        self.assertEqual(first, document_id("https://a.example/story"))
+        self.assertNotEqual(first, document_id("https://a.example/other"))
+        self.assertRegex(first, r"^[0-9a-f]{32}$")
+
+    def test_extract_published_dt(self):
+        published = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+        fallback = datetime(2025, 6, 8, tzinfo=timezone.utc)
+        entry = MockEntry({
+            "published": "Sun, 01 Jun 2025 12:30:00 +0000",
+            "published_parsed": published.timetuple(),
+        })
+        self.assertEqual(extract_published_dt(entry, fallback), published)
+        undated = MockEntry({"published": "sometime last week"})
+        self.assertEqual(extract_published_dt(undated, fallback), fallback)
+
+    def test_is_newest_first(self):
+        now = datetime.now(timezone.utc)
+        newer = MockEntry({"published_parsed": now.timetuple()})
+        older = MockEntry(
+            {"published_parsed": (now - timedelta(days=1)).timetuple()}
+        )
+        undated = MockEntry({})
+        self.assertTrue(is_newest_first([newer, older]))
+        self.assertFalse(is_newest_first([older, newer]))
+        self.assertFalse(is_newest_first([newer, undated]))
+
+    def test_index_documents_records_only_accepted_docs(self):
+        docs = [
+            {
+                "id": key,
+                "title": key.upper(),
+                "summary": "",
+                "url": "https://a.example/" + key,
+                "author": "",
+                "tags": ["nuclear"],
+                "publishedDate": "",
+                "source": "",
+            }
+            for key in ("a", "b")
+        ]
+        sender = FakeBufferedSender(failed_keys={"b"})
+        ws = Workbook().active
+        upload_log = io.StringIO()
+        indexed = index_documents(
+            docs, ws, sender, upload_log, DummyLogger()
+        )
+        self.assertEqual(indexed, [docs[0]])
+        self.assertEqual(ws.max_row, 1)
+        self.assertTrue(sender.closed)
+        self.assertEqual(upload_log.getvalue().count("\n"), 1)
+
+    def test_process_feed_stops_after_run_of_old_entries(self):
+        now = datetime.now(timezone.utc)
+        old_date = now - timedelta(days=10)
+
+        def entry(n, published=None):
+            fields = {
+                "title": "Nuclear story %d" % n,
+                "link": "https://a.example/%d" % n,
+                "summary": "Plant update.",
+            }
+            if published is not None:
+                fields["published"] = published.strftime(
+                    "%a, %d %b %Y %H:%M:%S %z"
+                )
+                fields["published_parsed"] = published.timetuple()
+            return MockEntry(fields)
+
+        # The undated first entry means the feed is not strictly ordered.
+        entries = [entry(0)]
+        entries += [entry(n, old_date) for n in range(1, 6)]
+        entries.append(entry(6, now))
+        feed = MockEntry({"entries": entries})
+        candidates = []
+        process_feed(
+            "https://a.example/feed",
+            feed,
+            now - timedelta(days=7),
+            set(),
+            candidates,
+            DummyLogger(),
+            now,
+        )
+        self.assertEqual(
+            [e.link for e, _, _ in candidates], ["https://a.example/0"]
+        )
+
+    def test_get_entry_summary_keeps_short_english_summary(self):
+        entry = MockEntry({
+            "title": "Short",
+            "summary": "<p>The reactor restarted &amp; is online.</p>",
+        })
+        # No client is needed: the short blurb never reaches OpenAI.
+        self.assertEqual(
+            get_entry_summary(entry, None, "model", DummyLogger()),
+            "The reactor restarted & is online.",
+        )
+
+    def test_summarize_entries_reuses_cached_summaries(self):
+        cache = open_summary_cache(":memory:")
+        body = "<p>%s</p>" % ("Le réacteur a redémarré. " * 30)
+        entries = [
+            MockEntry({"title": "A", "summary": body}),
+            MockEntry({"title": "B", "summary": body}),
+        ]
+        client = FakeOpenAI()
+        first = summarize_entries(entries, client, "model", DummyLogger(),
+                                  cache=cache)
+        second = summarize_entries(entries, client, "model", DummyLogger(),
+                                   cache=cache)
+        self.assertEqual(first, ["summary 1", "summary 1"])
+        self.assertEqual(second, first)
+        self.assertEqual(client.calls, 1)
+        cache.close()
+
+    def test_summarize_batch_uses_one_request(self):
+        entries = [
+            MockEntry({"title": "Short", "summary": "Reactor online."}),
+        ] + [
+            MockEntry({"title": str(n), "summary": "réacteur %d " % n * 60})
+            for n in (1, 2)
+        ]
+        client = FakeOpenAI()
+        self.assertEqual(
+            summarize_batch(entries, client, "model", DummyLogger()),
+            ["Reactor online.", "summary 1", "summary 2"],
+        )
+        self.assertEqual(client.calls, 1)
+
+    def test_summarize_batch_retries_null_summary_alone(self):
+        entries = [
+            MockEntry({"title": str(n), "summary": "réacteur %d " % n * 60})
+            for n in (1, 2)
+        ]
+        client = FakeOpenAI(batch_items=[
+            {"id": 0, "summary": "batched 0"},
+            {"id": 1, "summary": None},
+        ])
+        self.assertEqual(
+            summarize_batch(entries, client, "model", DummyLogger()),
+            ["batched 0", "summary 2"],
+        )
+        self.assertEqual(client.calls, 2)
+
+    def test_summarize_batch_retries_missing_summary_alone(self):
+        entries = [
+            MockEntry({"title": str(n), "summary": "réacteur %d " % n * 60})
+            for n in (1, 2)
+        ]
+        client = FakeOpenAI(batch_items=[
+            {"id": 0},
+            {"id": 1, "summary": "batched 1"},
+        ])
+        self.assertEqual(
+            summarize_batch(entries, client, "model", DummyLogger()),
+            ["summary 2", "batched 1"],
+        )
+        self.assertEqual(client.calls, 2)
+
+    def test_summarize_batch_falls_back_to_single_requests(self):
+        entries = [
+            MockEntry({"title": str(n), "summary": "réacteur %d " % n * 60})
+            for n in (1, 2)
+        ]
+        client = FakeOpenAI(batch_reply=False)
+        self.assertEqual(
+            summarize_batch(entries, client, "model", DummyLogger()),
+            ["summary 2", "summary 3"],
+        )
+        self.assertEqual(client.calls, 3)
+
+    def test_summarize_entries_caps_batch_text(self):
+        # Eight full-length bodies exceed the per-request text cap.
+        entries = [
+            MockEntry({"title": str(n), "summary": ("réacteur %d " % n) * 400})
+            for n in range(8)
+        ]
+        client = FakeOpenAI()
+        summaries = summarize_entries(entries, client, "model", DummyLogger())
+        self.assertEqual(client.calls, 2)
+        self.assertTrue(all(summaries))
+
+    def test_token_bucket_waits_for_refill(self):
+        clock = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        bucket = TokenBucket(600, clock=lambda: clock[0], sleep=sleep)
+        bucket.acquire(600)
+        self.assertEqual(sleeps, [])
+        bucket.acquire(100)
+        self.assertEqual(sleeps, [10.0])
+
+    def test_fetch_feed_sends_cached_validators_and_skips_304(self):
+        url = "https://a.example/feed"
+        cache = {url: {"etag": '"v1"', "last_modified": None,
+                       "body_sha": "x"}}
+        response = FakeResponse(304)
+        with mock.patch(
+            "nuclear_news_indexer._SESSION.get", return_value=response
+        ) as get:
+            self.assertEqual(fetch_feed_with_timeout(url, cache=cache),
+                             (url, None))
+        self.assertEqual(
+            get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+        )
+        self.assertEqual(cache[url]["etag"], '"v1"')
+
+    def test_fetch_feed_skips_unchanged_body(self):
+        url = "https://a.example/feed"
+        body = b"<rss version='2.0'><channel><title>F</title></channel></rss>"
+        cache = {}
+        with mock.patch(
+            "nuclear_news_indexer._SESSION.get",
+            side_effect=lambda *a, **k: FakeResponse(200, body),
+        ):
+            _, feed = fetch_feed_with_timeout(url, cache=cache)
+            self.assertEqual(feed.feed.title, "F")
+            self.assertEqual(fetch_feed_with_timeout(url, cache=cache),
+                             (url, None))
+
+    def test_process_entry_skips_entries_without_summary_text(self):
+        candidates = []
+        seen = set()
+        for n, summary in enumerate(["", "<p> </p>", "Reactor news."]):
+            entry = MockEntry(
+                {
+                    "title": "Nuclear story %d" % n,
+                    "link": "https://a.example/%d" % n,
+                    "summary": summary,
+                }
+            )
+            process_entry(entry, {}, seen, candidates, DummyLogger())
+        self.assertEqual(
+            [e.link for e, _, _ in candidates], ["https://a.example/2"]
+        )
+        self.assertEqual(seen, {"https://a.example/2"})
+
+    def test_read_body_with_deadline_raises_past_deadline(self):
+        response = FakeResponse(200, b"<rss/>")
+        with self.assertRaises(TimeoutError):
+            read_body_with_deadline(response, time.monotonic() - 1)
+        self.assertEqual(
+            read_body_with_deadline(
+                FakeResponse(200, b"<rss/>"), time.monotonic() + 60
+            ),
+            b"<rss/>",
+        )
+
+    def test_forget_unindexed_feeds_keeps_fully_indexed_feeds(self):
+        cache = {"https://a.example/feed": {}, "https://b.example/feed": {},
+                 "https://c.example/feed": {}}
+        forget_unindexed_feeds(
+            cache,
+            {
+                "https://a.example/feed": ["https://a.example/1"],
+                "https://b.example/feed": ["https://b.example/1",
+                                           "https://b.example/2"],
+                "https://c.example/feed": [],
+            },
+            {"https://a.example/1", "https://b.example/1"},
+        )
+        self.assertEqual(
+            sorted(cache), ["https://a.example/feed", "https://c.example/feed"]
+        )
+
+    def test_seen_urls_round_trip(self):
+        conn = open_seen_urls_db(":memory:")
+        record_seen_urls(conn, ["https://a.example/1", "https://a.example/1"])
+        record_seen_urls(conn, ["https://a.example/2"])
+        seen = SeenUrls(conn)
+        self.assertIn("https://a.example/1", seen)
+        self.assertIn("https://a.example/2", seen)
+        self.assertNotIn("https://a.example/3", seen)
+        seen.add("https://a.example/3")
+        self.assertIn("https://a.example/3", seen)
+        conn.close()
+
+class FakeRaw(io.BytesIO):
+    def read1(self, size=-1, decode_content=False):
+        return super().read1(size)
+
+class FakeResponse:
+    def __init__(self, status_code, body=b""):
+        self.status_code = status_code
+        self.headers = {}
+        self.raw = FakeRaw(body)
+    def __enter__(self):
+        return self
+    def __exit__(self, *args):
+        pass
+    def raise_for_status(self):
+        pass
+
+class FakeBufferedSender:
+    def __init__(self, failed_keys=()):
+        self.failed_keys = set(failed_keys)
+        self.closed = False
+    def __call__(self, on_progress, on_error):
+        self.on_progress = on_progress
+        self.on_error = on_error
+        return self
+    def __enter__(self):
+        return self
+    def __exit__(self, *args):
+        self.closed = True
+    def upload_documents(self, documents):
+        # Report real IndexAction objects, as the SDK's sender does.
+        actions = IndexDocumentsBatch().add_upload_actions(documents)
+        for doc, action in zip(documents, actions):
+            if doc["id"] in self.failed_keys:
+                self.on_error(action)
+            else:
+                self.on_progress(action)
+
+class FakeOpenAI:
+    def __init__(self, batch_reply=True, batch_items=None):
+        self.batch_reply = batch_reply
+        self.batch_items = batch_items
+        self.calls = 0
+        self.chat = self
+        self.completions = self
+    def create(self, model, messages, **kwargs):
+        self.calls += 1
+        content = "summary %d" % self.calls
+        if "response_format" in kwargs and self.batch_reply:
+            ids = re.findall(r"Article (\d+):", messages[0]["content"])
+            items = self.batch_items
+            if items is None:
+                items = [
+                    {"id": int(i), "summary": "summary %s" % i} for i in ids
+                ]
+            content = json.dumps({"summaries": items})
+        message = MockEntry({"content": content})
+        return MockEntry({"choices": [MockEntry({"message": message})]})
+
 class DummyLogger:
-    def info(self, msg):
+    def debug(self, msg, *args):
+        # Dummy logger for testing: does nothing
+        pass
+    def info(self, msg, *args):
         # Dummy logger for testing: does nothing
         pass
-    def warning(self, msg):
+    def warning(self, msg, *args):
         # Dummy logger for testing: does nothing
         pass
-    def error(self, msg):
+    def error(self, msg, *args):
         # Dummy logger for testing: does nothing
         pass
 